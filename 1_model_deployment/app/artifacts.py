@@ -0,0 +1,102 @@
+"""
+Fetching model artifacts from where the training job stored them.
+
+Vertex AI passes the artifact location in `AIP_STORAGE_URI`, a `gs://` URI.
+A plain directory path (or a `file://` URI) is accepted too, which stands in
+for Cloud Storage when running locally or in tests.
+"""
+
+# Python Standard Library Imports
+import os
+import pathlib
+import shutil
+import tempfile
+from typing import Union
+
+# Third Party Imports
+from google.cloud import storage
+from loguru import logger
+
+
+class ArtifactSource:
+    """
+    Somewhere artifacts can be downloaded from
+    """
+
+    def fingerprint(self, name: str) -> str:
+        """
+        A string that changes whenever the contents of the artifact change
+        """
+        raise NotImplementedError
+
+    def download(self, name: str, destination: pathlib.Path):
+        raise NotImplementedError
+
+
+class GCSArtifactSource(ArtifactSource):
+    def __init__(self, storage_uri: str, client=None):
+        self.storage_uri = storage_uri.rstrip("/")
+        self.client = client or storage.Client()
+
+    def _blob(self, name: str):
+        blob = storage.Blob.from_string(f"{self.storage_uri}/{name}", self.client)
+        blob.reload()
+        return blob
+
+    def fingerprint(self, name: str) -> str:
+        # the generation changes every time the object is overwritten
+        return str(self._blob(name).generation)
+
+    def download(self, name: str, destination: pathlib.Path):
+        self._blob(name).download_to_filename(str(destination))
+
+
+class LocalArtifactSource(ArtifactSource):
+    def __init__(self, directory: Union[str, pathlib.Path]):
+        self.directory = pathlib.Path(directory)
+
+    def fingerprint(self, name: str) -> str:
+        stat = (self.directory / name).stat()
+        return f"{stat.st_size}-{stat.st_mtime_ns}"
+
+    def download(self, name: str, destination: pathlib.Path):
+        shutil.copyfile(self.directory / name, destination)
+
+
+def artifact_source(storage_uri: str) -> ArtifactSource:
+    if storage_uri.startswith("gs://"):
+        return GCSArtifactSource(storage_uri)
+    return LocalArtifactSource(storage_uri.removeprefix("file://"))
+
+
+class ArtifactCache:
+    """
+    A local directory of downloaded artifacts, keyed by the fingerprint of
+    their source. An artifact that is already in the cache, for example after
+    a container restart with a persistent disk, is not downloaded again.
+    """
+
+    def __init__(self, cache_dir: Union[str, pathlib.Path]):
+        self.cache_dir = pathlib.Path(cache_dir)
+
+    def fetch(self, source: ArtifactSource, name: str) -> pathlib.Path:
+        fingerprint = source.fingerprint(name)
+        cached_path = self.cache_dir / fingerprint / name
+        if cached_path.exists():
+            logger.info(f"Using cached artifact {cached_path}")
+            return cached_path
+
+        logger.info(f"Downloading {name} into {cached_path}")
+        cached_path.parent.mkdir(parents=True, exist_ok=True)
+        # download next to the final path and rename it into place, so that a
+        # partially downloaded file is never mistaken for a cached one
+        with tempfile.NamedTemporaryFile(
+            dir=cached_path.parent, prefix=f".{name}.", delete=False
+        ) as download_f:
+            download_path = pathlib.Path(download_f.name)
+        try:
+            source.download(name, download_path)
+            os.replace(download_path, cached_path)
+        finally:
+            download_path.unlink(missing_ok=True)
+        return cached_path
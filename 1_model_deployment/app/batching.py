@@ -0,0 +1,142 @@
+# Python Standard Library Imports
+import asyncio
+import inspect
+from collections import deque
+from typing import Awaitable, Callable, Deque, List, Optional, Set, Tuple, Union
+
+# Third Party Imports
+import numpy as np
+from loguru import logger
+
+PredictFn = Callable[[np.ndarray], Union[np.ndarray, Awaitable[np.ndarray]]]
+
+
+class MicroBatcher:
+    """
+    Collects the rows of concurrent prediction requests into a single call to
+    `predict_fn`.
+
+    The first request to arrive opens a window of `max_wait_ms` milliseconds.
+    Every request that arrives before the window closes, or before
+    `max_batch_size` rows are waiting, is concatenated into one array,
+    predicted in one call, and the outputs are split back out to each caller.
+
+    `predict_fn` may be a coroutine function, e.g. `InferenceExecutor.predict`,
+    in which case the next batch is collected while the previous one runs.
+    """
+
+    def __init__(
+        self,
+        predict_fn: PredictFn,
+        max_batch_size: int = 64,
+        max_wait_ms: float = 2.0,
+        enabled: bool = True,
+    ):
+        self.predict_fn = predict_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.enabled = enabled
+
+        self._pending: Deque[Tuple[np.ndarray, asyncio.Future]] = deque()
+        self._pending_rows = 0
+        self._has_pending: Optional[asyncio.Event] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._running_batches: Set[asyncio.Task] = set()
+
+    async def predict(self, inputs: np.ndarray) -> np.ndarray:
+        if not self.enabled:
+            return await self._call_predict_fn(inputs)
+
+        # the worker is bound to the running event loop, so it is started on
+        # the first request rather than at import time
+        if self._worker is None or self._worker.done():
+            self._has_pending = asyncio.Event()
+            self._worker = asyncio.create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((inputs, future))
+        self._pending_rows += len(inputs)
+        self._has_pending.set()
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._has_pending.wait()
+
+            # keep the window open until it times out or the batch is full
+            deadline = loop.time() + self.max_wait
+            while self._pending_rows < self.max_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                self._has_pending.clear()
+                try:
+                    await asyncio.wait_for(self._has_pending.wait(), remaining)
+                except asyncio.TimeoutError:
+                    break
+
+            batch = self._take_batch()
+            if self._pending:
+                self._has_pending.set()
+            else:
+                self._has_pending.clear()
+
+            task = asyncio.create_task(self._predict_batch(batch))
+            self._running_batches.add(task)
+            task.add_done_callback(self._running_batches.discard)
+
+    def _take_batch(self) -> List[Tuple[np.ndarray, asyncio.Future]]:
+        """
+        Pop queued requests until adding the next one would exceed
+        `max_batch_size` rows. Requests are never split, so a single request
+        larger than `max_batch_size` is predicted on its own.
+        """
+        batch: List[Tuple[np.ndarray, asyncio.Future]] = []
+        n_rows = 0
+        while self._pending:
+            inputs, future = self._pending[0]
+            if batch and n_rows + len(inputs) > self.max_batch_size:
+                break
+            self._pending.popleft()
+            self._pending_rows -= len(inputs)
+            if future.done():  # the caller has gone away, e.g. disconnected
+                continue
+            batch.append((inputs, future))
+            n_rows += len(inputs)
+        return batch
+
+    async def _call_predict_fn(self, inputs: np.ndarray) -> np.ndarray:
+        outputs = self.predict_fn(inputs)
+        if inspect.isawaitable(outputs):
+            outputs = await outputs
+        return outputs
+
+    async def _predict_batch(self, batch: List[Tuple[np.ndarray, asyncio.Future]]):
+        if not batch:
+            return
+
+        try:
+            outputs = await self._call_predict_fn(
+                np.concatenate([inputs for inputs, _ in batch])
+            )
+        except Exception:
+            # one malformed request should not fail everyone it was batched
+            # with, so fall back to predicting each request on its own
+            logger.exception(f"Batched predict failed for {len(batch)} requests")
+            for inputs, future in batch:
+                try:
+                    outputs = await self._call_predict_fn(inputs)
+                except Exception as e:
+                    if not future.done():
+                        future.set_exception(e)
+                else:
+                    if not future.done():
+                        future.set_result(outputs)
+            return
+
+        offset = 0
+        for inputs, future in batch:
+            if not future.done():
+                future.set_result(outputs[offset : offset + len(inputs)])
+            offset += len(inputs)
@@ -0,0 +1,108 @@
+"""
+Request and response formats for bulk prediction.
+
+JSON (`{"instances": [[...], ...]}`) stays the default, since that's what
+Vertex AI sends. For large batches, the instances can instead be sent as
+binary, which is decoded straight into a NumPy array without copying it:
+
+* `application/x-npy` - an array saved with `np.save`
+* `application/octet-stream` - raw little-endian float32 values, with the
+  array's shape in an `X-Shape` header, e.g. `X-Shape: 50000,4`
+
+Predictions are returned in the format asked for by the `Accept` header, or
+else in the same format as the request. Binary responses hold the predicted
+class indices as little-endian int32, rather than class names.
+"""
+
+# Python Standard Library Imports
+import io
+import json
+from typing import Mapping, Optional
+
+# Third Party Imports
+import numpy as np
+from fastapi import Response
+
+JSON = "application/json"
+NPY = "application/x-npy"
+RAW = "application/octet-stream"
+MEDIA_TYPES = (JSON, NPY, RAW)
+
+SHAPE_HEADER = "X-Shape"
+
+
+class UnsupportedMediaTypeError(ValueError):
+    pass
+
+
+def media_type(header: Optional[str]) -> str:
+    """
+    The media type of a `Content-Type` header, without any parameters
+    """
+    if not header:
+        return JSON
+    return header.split(";", 1)[0].strip().lower()
+
+
+def negotiate(accept: Optional[str], request_media_type: str) -> str:
+    """
+    The first supported media type in the `Accept` header, or the request's
+    own media type if none of them are supported
+    """
+    for accepted in (accept or "").split(","):
+        accepted = accepted.split(";", 1)[0].strip().lower()
+        if accepted in MEDIA_TYPES:
+            return accepted
+    return request_media_type
+
+
+def decode_instances(
+    body: bytes, content_type: str, headers: Mapping[str, str]
+) -> np.ndarray:
+    if content_type == JSON:
+        return np.asarray(json.loads(body)["instances"])
+    if content_type == NPY:
+        return _decode_npy(body)
+    if content_type == RAW:
+        return _decode_raw(body, headers.get(SHAPE_HEADER))
+    raise UnsupportedMediaTypeError(
+        f"Unsupported content type {content_type!r}, use one of {MEDIA_TYPES}"
+    )
+
+
+def _decode_npy(body: bytes) -> np.ndarray:
+    header = io.BytesIO(body)
+    version = np.lib.format.read_magic(header)
+    if version == (1, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(header)
+    else:
+        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(header)
+    if dtype.hasobject:
+        raise ValueError("Arrays of Python objects are not accepted")
+    array = np.frombuffer(
+        body, dtype=dtype, count=int(np.prod(shape)), offset=header.tell()
+    )
+    return array.reshape(shape, order="F" if fortran_order else "C")
+
+
+def _decode_raw(body: bytes, shape_header: Optional[str]) -> np.ndarray:
+    if not shape_header:
+        raise ValueError(f"Raw float32 instances need an {SHAPE_HEADER} header")
+    shape = tuple(int(dimension) for dimension in shape_header.split(","))
+    return np.frombuffer(body, dtype="<f4").reshape(shape)
+
+
+def encode_predictions(class_indices: np.ndarray, response_media_type: str) -> Response:
+    """
+    A binary response holding the predicted class indices
+    """
+    class_indices = np.ascontiguousarray(class_indices, dtype="<i4")
+    if response_media_type == NPY:
+        content = io.BytesIO()
+        np.save(content, class_indices)
+        return Response(content.getvalue(), media_type=NPY)
+    return Response(
+        class_indices.tobytes(),
+        media_type=RAW,
+        headers={SHAPE_HEADER: ",".join(map(str, class_indices.shape))},
+    )
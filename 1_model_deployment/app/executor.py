@@ -0,0 +1,98 @@
+# Python Standard Library Imports
+import asyncio
+import multiprocessing
+import pathlib
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional, Union
+
+# Third Party Imports
+import numpy as np
+from loguru import logger
+
+# app Imports
+from app.model_io import load_model
+
+BACKENDS = ("inline", "thread", "process")
+
+# the copy of the model owned by a process pool worker, and where it came from
+_worker_model = None
+_worker_model_path: Optional[str] = None
+
+
+def _load_worker_model(model_path: Optional[str], mmap: bool):
+    global _worker_model, _worker_model_path
+    if model_path is not None and model_path != _worker_model_path:
+        _worker_model = load_model(model_path, mmap=mmap)
+        _worker_model_path = model_path
+
+
+def _predict_in_worker(model_path: str, mmap: bool, inputs: np.ndarray) -> np.ndarray:
+    # a worker only reloads when the executor has been pointed at a new model
+    _load_worker_model(model_path, mmap)
+    return _worker_model.predict(inputs)
+
+
+class InferenceExecutor:
+    """
+    Runs `model.predict` off the event loop, so that a long prediction does
+    not hold up every other request, including the health check.
+
+    With the "process" backend, the model is not sent to the workers with
+    every call. Instead, each worker loads it from `model_path`, when the
+    worker starts, or when `set_model` points the executor at a new path.
+    """
+
+    def __init__(
+        self,
+        model=None,
+        model_path: Optional[Union[str, pathlib.Path]] = None,
+        backend: str = "thread",
+        max_workers: Optional[int] = None,
+        mmap: bool = False,
+    ):
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown inference backend {backend!r}, use {BACKENDS}")
+
+        self.backend = backend
+        self.max_workers = max_workers
+        self.mmap = mmap
+        self.set_model(model, model_path)
+        self._pool: Optional[Executor] = self._create_pool()
+        logger.info(f"Running inference with the {backend} backend")
+
+    def set_model(self, model, model_path: Optional[Union[str, pathlib.Path]] = None):
+        self.model = model
+        self.model_path = None if model_path is None else str(model_path)
+
+    def _create_pool(self) -> Optional[Executor]:
+        if self.backend == "thread":
+            return ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="inference"
+            )
+        if self.backend == "process":
+            # spawn rather than fork, since the server process already has
+            # threads running by the time the pool is created
+            return ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_load_worker_model,
+                initargs=(self.model_path, self.mmap),
+            )
+        return None
+
+    async def predict(self, inputs: np.ndarray) -> np.ndarray:
+        if self._pool is None:
+            return self.model.predict(inputs)
+
+        loop = asyncio.get_running_loop()
+        if self.backend == "process":
+            if self.model_path is None:
+                raise RuntimeError("The process backend needs a model_path to load")
+            return await loop.run_in_executor(
+                self._pool, _predict_in_worker, self.model_path, self.mmap, inputs
+            )
+        return await loop.run_in_executor(self._pool, self.model.predict, inputs)
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
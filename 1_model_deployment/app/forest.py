@@ -0,0 +1,145 @@
+"""
+A random forest compiled into flat NumPy arrays.
+
+scikit-learn predicts with a random forest by dispatching to each tree in
+turn. `CompiledForest` instead stores the nodes of every tree in a single set
+of contiguous arrays, and walks all of the trees for a whole batch of rows one
+level at a time, so a prediction is a fixed number of vectorized NumPy
+operations regardless of how many trees there are.
+"""
+
+# Python Standard Library Imports
+import pathlib
+from typing import Union
+
+# Third Party Imports
+import numpy as np
+
+# rows are evaluated in chunks so that the (n_trees, n_rows) node indices and
+# (n_trees, n_rows, n_classes) leaf values stay a bounded size
+DEFAULT_CHUNK_SIZE = 1024
+
+
+class CompiledForest:
+    def __init__(
+        self,
+        feature: np.ndarray,
+        threshold: np.ndarray,
+        children_left: np.ndarray,
+        children_right: np.ndarray,
+        value: np.ndarray,
+        roots: np.ndarray,
+        max_depth: int,
+        classes: np.ndarray,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        self.feature = feature
+        self.threshold = threshold
+        self.children_left = children_left
+        self.children_right = children_right
+        self.value = value
+        self.roots = roots
+        self.max_depth = int(max_depth)
+        self.classes_ = classes
+        self.chunk_size = chunk_size
+        # node i's left child is at 2 * i, and its right child at 2 * i + 1,
+        # so that choosing a child is a single gather
+        self._children = np.stack([children_left, children_right], axis=1).ravel()
+
+    @property
+    def n_trees(self) -> int:
+        return len(self.roots)
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        # scikit-learn casts features to float32 before comparing them with
+        # the thresholds, so cast the same way to split on exactly the same side
+        X = np.asarray(X, dtype=np.float32)
+        if X.ndim != 2:
+            raise ValueError(f"Expected a 2D array of features, got shape {X.shape}")
+
+        probabilities = np.empty((len(X), len(self.classes_)), dtype=np.float64)
+        for start in range(0, len(X), self.chunk_size):
+            chunk = X[start : start + self.chunk_size]
+            probabilities[start : start + len(chunk)] = self._predict_proba_chunk(chunk)
+        return probabilities
+
+    def _predict_proba_chunk(self, X: np.ndarray) -> np.ndarray:
+        n_rows = len(X)
+        # feature-major, so that feature f of row r is at f * n_rows + r
+        features = np.ascontiguousarray(X.T).ravel()
+        rows = np.arange(n_rows)
+        # the current node of every tree, for every row
+        nodes = np.repeat(self.roots[:, np.newaxis], n_rows, axis=1)
+        for _ in range(self.max_depth):
+            go_right = features[self.feature[nodes] * n_rows + rows] > (
+                self.threshold[nodes]
+            )
+            nodes = self._children[2 * nodes + go_right]
+        return self.value[nodes].mean(axis=0)
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        return self.classes_.take(np.argmax(self.predict_proba(X), axis=1))
+
+    def save(self, path: Union[str, pathlib.Path]):
+        np.savez(
+            path,
+            feature=self.feature,
+            threshold=self.threshold,
+            children_left=self.children_left,
+            children_right=self.children_right,
+            value=self.value,
+            roots=self.roots,
+            max_depth=self.max_depth,
+            classes=self.classes_,
+        )
+
+    @classmethod
+    def load(cls, path: Union[str, pathlib.Path]) -> "CompiledForest":
+        with np.load(path) as arrays:
+            return cls(**{name: arrays[name] for name in arrays.files})
+
+
+def compile_forest(model) -> CompiledForest:
+    """
+    Flatten a fitted `RandomForestClassifier` into a `CompiledForest`.
+
+    The trees' nodes are concatenated, with child indices offset to point into
+    the concatenated arrays. Leaves point back to themselves, so that every
+    row can be advanced `max_depth` times without checking whether it has
+    already reached a leaf.
+    """
+    if model.n_outputs_ != 1:
+        raise ValueError("Only single output forests can be compiled")
+
+    features, thresholds, lefts, rights, values, roots = [], [], [], [], [], []
+    max_depth = 0
+    offset = 0
+    for estimator in model.estimators_:
+        tree = estimator.tree_
+        node_ids = np.arange(tree.node_count)
+        is_leaf = tree.children_left == -1
+
+        features.append(np.where(is_leaf, 0, tree.feature))
+        thresholds.append(np.where(is_leaf, np.inf, tree.threshold))
+        lefts.append(np.where(is_leaf, node_ids, tree.children_left) + offset)
+        rights.append(np.where(is_leaf, node_ids, tree.children_right) + offset)
+
+        # each leaf's class distribution, normalized like tree.predict_proba
+        leaf_values = tree.value[:, 0, :]
+        totals = leaf_values.sum(axis=1, keepdims=True)
+        values.append(leaf_values / np.where(totals == 0, 1, totals))
+
+        roots.append(offset)
+        max_depth = max(max_depth, tree.max_depth)
+        offset += tree.node_count
+
+    return CompiledForest(
+        feature=np.concatenate(features).astype(np.intp),
+        threshold=np.concatenate(thresholds).astype(np.float64),
+        children_left=np.concatenate(lefts).astype(np.intp),
+        children_right=np.concatenate(rights).astype(np.intp),
+        value=np.concatenate(values),
+        roots=np.asarray(roots, dtype=np.intp),
+        max_depth=max_depth,
+        classes=model.classes_,
+    )
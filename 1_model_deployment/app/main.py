@@ -2,25 +2,33 @@
 import json
 import os
 import pickle
+from contextlib import asynccontextmanager
 
 # Third Party Imports
-import joblib
 import numpy as np
-from fastapi import FastAPI, Request
-from google.cloud import storage
+from fastapi import FastAPI, HTTPException, Request, Response
 from pydantic import BaseModel
 from sklearn.datasets import load_iris
 
-app = FastAPI()
-gcs_client = storage.Client()
-
-with open("model.joblib", "wb") as model_f:
-    gcs_client.download_blob_to_file(
-        f"{os.environ['AIP_STORAGE_URI']}/model.joblib", model_f
-    )
+# app Imports
+from app import codecs, settings, streaming
+from app.serving import ModelNotReadyError, ModelServer
 
 _class_names = load_iris().target_names
-_model = joblib.load("model.joblib")
+_server = ModelServer()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    _server.start()
+    yield
+    _server.stop()
+
+
+app = FastAPI(lifespan=lifespan)
+app.include_router(
+    streaming.create_router(_server, _class_names, settings.STREAM_CHUNK_SIZE)
+)
 
 
 @app.get("/")
@@ -29,14 +37,39 @@ def greet_user():
 
 
 @app.get(os.environ["AIP_HEALTH_ROUTE"], status_code=200)
-def health():
-    return {"message": "Model API is healthy!"}
+def health(response: Response):
+    if not _server.ready:
+        response.status_code = 503
+        return {
+            "message": f"Model is {_server.registry.state}",
+            "state": _server.registry.state,
+        }
+    return {"message": "Model API is healthy!", "state": _server.registry.state}
+
+
+@app.get("/model")
+def model_version():
+    return _server.describe()
 
 
 @app.post(os.environ["AIP_PREDICT_ROUTE"])
 async def predict(request: Request):
-    body = await request.json()
-    instances = body["instances"]
-    inputs = np.asarray(instances)
-    outputs = _model.predict(inputs)
+    content_type = codecs.media_type(request.headers.get("content-type"))
+    try:
+        inputs = codecs.decode_instances(
+            await request.body(), content_type, request.headers
+        )
+    except codecs.UnsupportedMediaTypeError as e:
+        raise HTTPException(status_code=415, detail=str(e)) from e
+    except (ValueError, KeyError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid instances: {e}") from e
+
+    try:
+        outputs = await _server.predict(inputs)
+    except ModelNotReadyError as e:
+        raise HTTPException(status_code=503, detail=str(e)) from e
+
+    response_media_type = codecs.negotiate(request.headers.get("accept"), content_type)
+    if response_media_type != codecs.JSON:
+        return codecs.encode_predictions(outputs, response_media_type)
     return {"predictions": [_class_names[class_num] for class_num in outputs]}
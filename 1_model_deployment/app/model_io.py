@@ -0,0 +1,38 @@
+# Python Standard Library Imports
+import json
+import pathlib
+from typing import Optional, Union
+
+# Third Party Imports
+import joblib
+import numpy as np
+from loguru import logger
+
+# app Imports
+from app.forest import CompiledForest
+
+
+def load_model(model_path: Union[str, pathlib.Path], mmap: bool = False):
+    """
+    Load a model artifact written by `train_model.py`, either the pickled
+    scikit-learn model (`.joblib`) or the compiled forest (`.npz`).
+
+    With `mmap`, the arrays inside a `.joblib` artifact are memory-mapped
+    read-only instead of being read into memory, so loading is quick and
+    processes serving the same file share its pages.
+    """
+    if pathlib.Path(model_path).suffix == ".npz":
+        return CompiledForest.load(model_path)
+    return joblib.load(model_path, mmap_mode="r" if mmap else None)
+
+
+def load_instances(instances_path: Union[str, pathlib.Path]) -> Optional[np.ndarray]:
+    """
+    Load the instances of an example prediction request, like `instances.json`
+    """
+    instances_path = pathlib.Path(instances_path)
+    if not instances_path.exists():
+        logger.warning(f"Could not find {instances_path}, skipping model warm up")
+        return None
+    with open(instances_path, "r") as instances_f:
+        return np.asarray(json.load(instances_f)["instances"])
@@ -1,14 +1,31 @@
+# Python Standard Library Imports
+from contextlib import asynccontextmanager
+
 # Third Party Imports
-import joblib
 import numpy as np
 import pydantic
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException
 from sklearn.datasets import load_iris
 
-app = FastAPI()
+# app Imports
+from app import settings, streaming
+from app.serving import ModelNotReadyError, ModelServer
 
 iris_class_names = load_iris().target_names
-model = joblib.load("model.joblib")
+server = ModelServer()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    server.start()
+    yield
+    server.stop()
+
+
+app = FastAPI(lifespan=lifespan)
+app.include_router(
+    streaming.create_router(server, iris_class_names, settings.STREAM_CHUNK_SIZE)
+)
 
 
 class IrisSample(pydantic.BaseModel):
@@ -23,18 +40,26 @@ def hello_world():
     return {"message": "Hello World!"}
 
 
+@app.get("/model")
+def model_version():
+    return server.describe()
+
+
 @app.post("/predict")
 async def predict(sample: IrisSample):
-    prediction = model.predict(
-        np.asarray(
-            [
+    try:
+        prediction = await server.predict(
+            np.asarray(
                 [
-                    sample.sepal_length,
-                    sample.sepal_width,
-                    sample.petal_length,
-                    sample.petal_width,
+                    [
+                        sample.sepal_length,
+                        sample.sepal_width,
+                        sample.petal_length,
+                        sample.petal_width,
+                    ]
                 ]
-            ]
+            )
         )
-    )
+    except ModelNotReadyError as e:
+        raise HTTPException(status_code=503, detail=str(e)) from e
     return {"prediction": iris_class_names[prediction[0]]}
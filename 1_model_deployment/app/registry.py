@@ -0,0 +1,178 @@
+# Python Standard Library Imports
+import pathlib
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field, fields
+from typing import Any, Callable, Deque, Dict, Optional
+
+# Third Party Imports
+import numpy as np
+from loguru import logger
+
+# app Imports
+from app.artifacts import ArtifactCache, ArtifactSource
+from app.model_io import load_model
+
+LOADING = "loading"
+READY = "ready"
+FAILED = "failed"
+
+
+@dataclass
+class ModelVersion:
+    version: str
+    model_path: str
+    loaded_at: float
+    fetch_seconds: float
+    load_seconds: float
+    warm_seconds: float
+    # from noticing the new artifact to serving it
+    swap_seconds: float
+    model: Any = field(default=None, repr=False)
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            version_field.name: getattr(self, version_field.name)
+            for version_field in fields(self)
+            if version_field.name != "model"
+        }
+
+
+class ModelRegistry:
+    """
+    Fetches the model artifact through the artifact cache and loads it in a
+    background thread, so that the service can answer health checks, as not
+    ready, while the model is still being downloaded.
+
+    Every `poll_interval` seconds the registry checks whether the artifact has
+    changed. A new version is loaded and warmed up with `warmup_inputs` in the
+    background, and then swapped in by replacing `active` in one assignment.
+    Requests that already hold a reference to the old model finish on it.
+
+    `on_load` is called with the model and the local path it was loaded from,
+    just before it starts serving.
+    """
+
+    def __init__(
+        self,
+        source: ArtifactSource,
+        cache: ArtifactCache,
+        model_filename: str,
+        mmap: bool = True,
+        on_load: Optional[Callable[[object, pathlib.Path], None]] = None,
+        poll_interval: float = 0,
+        warmup_inputs: Optional[np.ndarray] = None,
+        history_size: int = 10,
+    ):
+        self.source = source
+        self.cache = cache
+        self.model_filename = model_filename
+        self.mmap = mmap
+        self.on_load = on_load
+        self.poll_interval = poll_interval
+        self.warmup_inputs = warmup_inputs
+
+        self.state = LOADING
+        self.error: Optional[BaseException] = None
+        self.active: Optional[ModelVersion] = None
+        self.history: Deque[ModelVersion] = deque(maxlen=history_size)
+        self._failed_version: Optional[str] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def ready(self) -> bool:
+        return self.active is not None
+
+    @property
+    def model(self):
+        return None if self.active is None else self.active.model
+
+    def start(self) -> threading.Thread:
+        self._thread = threading.Thread(
+            target=self._run, name="model-registry", daemon=True
+        )
+        self._thread.start()
+        return self._thread
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        self.poll()
+        if self.poll_interval <= 0:
+            return
+        while not self._stop.wait(self.poll_interval):
+            self.poll()
+
+    def poll(self):
+        """
+        Load the artifact if it has changed since the active version
+        """
+        try:
+            version = self.source.fingerprint(self.model_filename)
+        except Exception as e:
+            logger.exception(f"Failed to check {self.model_filename} for changes")
+            self._record_failure(e)
+            return
+
+        if self.active is not None and version == self.active.version:
+            return
+        if version == self._failed_version:  # don't retry a broken artifact
+            return
+        self.load(version)
+
+    def load(self, version: str):
+        start = time.perf_counter()
+        try:
+            model_path = self.cache.fetch(self.source, self.model_filename)
+            fetched = time.perf_counter()
+            model = load_model(model_path, mmap=self.mmap)
+            loaded = time.perf_counter()
+            # the first predictions on a freshly loaded model are slower, while
+            # the memory-mapped pages are read in, so make them here
+            if self.warmup_inputs is not None:
+                model.predict(self.warmup_inputs)
+            warmed = time.perf_counter()
+        except Exception as e:
+            logger.exception(
+                f"Failed to load version {version} of {self.model_filename}"
+            )
+            self._failed_version = version
+            self._record_failure(e)
+            return
+
+        if self.on_load is not None:
+            self.on_load(model, model_path)
+        self.active = ModelVersion(
+            version=version,
+            model_path=str(model_path),
+            loaded_at=time.time(),
+            fetch_seconds=fetched - start,
+            load_seconds=loaded - fetched,
+            warm_seconds=warmed - loaded,
+            swap_seconds=time.perf_counter() - start,
+            model=model,
+        )
+        self.history.append(self.active)
+        self.state = READY
+        self.error = None
+        logger.info(
+            f"Serving version {version} of {self.model_filename}, "
+            f"swapped in after {self.active.swap_seconds:.3f} seconds"
+        )
+
+    def _record_failure(self, error: BaseException):
+        self.error = error
+        # if a version is already serving, keep serving it
+        if self.active is None:
+            self.state = FAILED
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "error": None if self.error is None else repr(self.error),
+            "active": None if self.active is None else self.active.describe(),
+            "history": [version.describe() for version in self.history],
+        }
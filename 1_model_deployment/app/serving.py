@@ -0,0 +1,68 @@
+# Python Standard Library Imports
+from typing import Any, Dict
+
+# Third Party Imports
+import numpy as np
+
+# app Imports
+from app import settings
+from app.artifacts import ArtifactCache, artifact_source
+from app.batching import MicroBatcher
+from app.executor import InferenceExecutor
+from app.model_io import load_instances
+from app.registry import ModelRegistry
+
+
+class ModelNotReadyError(Exception):
+    pass
+
+
+class ModelServer:
+    """
+    Everything the prediction services need to serve the model, configured
+    from `app.settings`: the registry that loads and hot-swaps the model, the
+    executor that runs it, and the micro-batcher in front of them.
+    """
+
+    def __init__(self):
+        self.executor = InferenceExecutor(
+            backend=settings.INFERENCE_BACKEND,
+            max_workers=settings.INFERENCE_WORKERS,
+            mmap=settings.MODEL_MMAP,
+        )
+        self.registry = ModelRegistry(
+            artifact_source(settings.MODEL_STORAGE_URI),
+            ArtifactCache(settings.ARTIFACT_CACHE_DIR),
+            settings.MODEL_FILENAME,
+            mmap=settings.MODEL_MMAP,
+            on_load=self.executor.set_model,
+            poll_interval=settings.MODEL_POLL_INTERVAL_SECONDS,
+            warmup_inputs=load_instances(settings.WARMUP_INSTANCES_PATH),
+        )
+        self.batcher = MicroBatcher(
+            self.executor.predict,
+            max_batch_size=settings.MAX_BATCH_SIZE,
+            max_wait_ms=settings.MAX_BATCH_WAIT_MS,
+            enabled=settings.MICRO_BATCHING_ENABLED,
+        )
+
+    @property
+    def ready(self) -> bool:
+        return self.registry.ready
+
+    def start(self):
+        # the model loads in the background, and the services report that
+        # they are not ready until it has
+        self.registry.start()
+
+    def stop(self):
+        self.registry.stop()
+        self.executor.shutdown()
+
+    async def predict(self, inputs: np.ndarray) -> np.ndarray:
+        if not self.ready:
+            raise ModelNotReadyError(f"Model is {self.registry.state}")
+        return await self.batcher.predict(inputs)
+
+    def describe(self) -> Dict[str, Any]:
+        return self.registry.describe()
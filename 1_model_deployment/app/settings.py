@@ -0,0 +1,52 @@
+"""
+Settings for the prediction services.
+
+Everything is read from environment variables, in the same way as the
+`AIP_*` variables Vertex AI injects, so each deployment can be tuned without
+rebuilding the image.
+"""
+
+# Python Standard Library Imports
+import os
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    return os.environ.get(name, str(default)).strip().lower() in {"1", "true", "yes"}
+
+
+# The model artifact to serve: `model.joblib` for the scikit-learn model, or
+# `model.npz` for the compiled forest written alongside it by train_model.py
+MODEL_FILENAME = os.environ.get("MODEL_FILENAME", "model.joblib")
+
+# Where the model artifact is stored: a `gs://` URI on Vertex AI, or a local
+# directory, which defaults to the directory train_model.py writes to
+MODEL_STORAGE_URI = os.environ.get("AIP_STORAGE_URI", ".")
+# How often to check the artifact for a new version to hot-swap in, or 0 to
+# only load it once at startup
+MODEL_POLL_INTERVAL_SECONDS = float(os.environ.get("MODEL_POLL_INTERVAL_SECONDS", "30"))
+# Example instances to warm up a new model version with, before it is swapped in
+WARMUP_INSTANCES_PATH = os.environ.get("WARMUP_INSTANCES_PATH", "instances.json")
+
+# Artifacts downloaded from the storage URI are kept here, keyed by their
+# generation, so a restart does not download an unchanged model again
+ARTIFACT_CACHE_DIR = os.environ.get("ARTIFACT_CACHE_DIR", ".artifact_cache")
+# Memory-map the model's arrays rather than reading them into memory
+MODEL_MMAP = _env_bool("MODEL_MMAP", True)
+
+# Micro-batching: concurrent requests are collected for up to
+# MAX_BATCH_WAIT_MS milliseconds, or until MAX_BATCH_SIZE rows are waiting,
+# and then predicted together in a single call to the model.
+MICRO_BATCHING_ENABLED = _env_bool("MICRO_BATCHING_ENABLED", True)
+MAX_BATCH_SIZE = int(os.environ.get("MAX_BATCH_SIZE", "64"))
+MAX_BATCH_WAIT_MS = float(os.environ.get("MAX_BATCH_WAIT_MS", "2"))
+
+# Where `model.predict` runs:
+# * "inline" - on the event loop, blocking it for the duration of the call
+# * "thread" - in a thread pool, for estimators that release the GIL
+# * "process" - in a process pool, where each worker loads its own copy of the
+#   model when it starts
+INFERENCE_BACKEND = os.environ.get("INFERENCE_BACKEND", "thread")
+INFERENCE_WORKERS = int(os.environ.get("INFERENCE_WORKERS", os.cpu_count() or 1))
+
+# Rows scored at a time by the streaming endpoint and score_file.py
+STREAM_CHUNK_SIZE = int(os.environ.get("STREAM_CHUNK_SIZE", "1024"))
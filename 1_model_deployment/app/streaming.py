@@ -0,0 +1,105 @@
+"""
+Scoring newline-delimited JSON (NDJSON) rows in fixed-size chunks.
+
+Each input line is one row of features, e.g. `[6.7, 3.1, 4.7, 1.5]`, and each
+output line is the prediction for the row on the same input line, e.g.
+`{"prediction": "versicolor"}`. Only one chunk of rows is held in memory at a
+time, so files of any size can be scored in constant memory.
+"""
+
+# Python Standard Library Imports
+import json
+from typing import AsyncIterator, Iterable, Iterator, List, Sequence
+
+# Third Party Imports
+import numpy as np
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from loguru import logger
+
+NDJSON = "application/x-ndjson"
+
+
+def parse_rows(lines: List[bytes]) -> np.ndarray:
+    # parsing the chunk as one JSON array is much faster than a line at a time
+    return np.asarray(json.loads(b"[" + b",".join(lines) + b"]"), dtype=np.float64)
+
+
+def iter_row_chunks(lines: Iterable[bytes], chunk_size: int) -> Iterator[np.ndarray]:
+    chunk: List[bytes] = []
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        chunk.append(line)
+        if len(chunk) == chunk_size:
+            yield parse_rows(chunk)
+            chunk = []
+    if chunk:
+        yield parse_rows(chunk)
+
+
+async def aiter_lines(byte_stream: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """
+    Split a stream of arbitrarily sized byte chunks, like a request body, into
+    lines
+    """
+    remainder = b""
+    async for data in byte_stream:
+        *lines, remainder = (remainder + data).split(b"\n")
+        for line in lines:
+            yield line
+    if remainder:
+        yield remainder
+
+
+async def aiter_row_chunks(
+    lines: AsyncIterator[bytes], chunk_size: int
+) -> AsyncIterator[np.ndarray]:
+    chunk: List[bytes] = []
+    async for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        chunk.append(line)
+        if len(chunk) == chunk_size:
+            yield parse_rows(chunk)
+            chunk = []
+    if chunk:
+        yield parse_rows(chunk)
+
+
+def encode_predictions(outputs: np.ndarray, class_names: Sequence[str]) -> bytes:
+    return "".join(
+        json.dumps({"prediction": class_names[class_num]}) + "\n"
+        for class_num in outputs
+    ).encode()
+
+
+def create_router(server, class_names: Sequence[str], chunk_size: int) -> APIRouter:
+    """
+    A `POST /predict/stream` route that scores an NDJSON request body with
+    `server`, streaming the predictions back as each chunk is scored
+    """
+    router = APIRouter()
+
+    @router.post("/predict/stream")
+    async def predict_stream(request: Request):
+        if not server.ready:
+            raise HTTPException(status_code=503, detail="Model is not loaded yet")
+
+        async def predictions() -> AsyncIterator[bytes]:
+            rows = aiter_row_chunks(aiter_lines(request.stream()), chunk_size)
+            try:
+                async for inputs in rows:
+                    outputs = await server.predict(inputs)
+                    yield encode_predictions(outputs, class_names)
+            except Exception as e:
+                # the response has already started, so the status code can't
+                # change any more; report the error as the last line instead
+                logger.exception("Failed to score streamed rows")
+                yield (json.dumps({"error": str(e)}) + "\n").encode()
+
+        return StreamingResponse(predictions(), media_type=NDJSON)
+
+    return router
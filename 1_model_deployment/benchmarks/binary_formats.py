@@ -0,0 +1,84 @@
+"""
+Compare the time spent decoding a bulk prediction request and encoding its
+response in each supported format, along with the size of their payloads.
+
+Run from the `1_model_deployment` directory:
+
+    python -m benchmarks.binary_formats --rows 50000
+"""
+
+# Python Standard Library Imports
+import argparse
+import io
+import json
+import time
+
+# Third Party Imports
+import numpy as np
+from sklearn.datasets import load_iris
+
+# app Imports
+from app import codecs
+
+
+def _median_seconds(fn, repeats):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return float(np.median(timings))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    iris = load_iris()
+    rng = np.random.default_rng(0)
+    rows = rng.integers(0, len(iris.data), size=args.rows)
+    instances = iris.data[rows].astype(np.float32)
+    class_indices = iris.target[rows]
+
+    npy_request = io.BytesIO()
+    np.save(npy_request, instances)
+    requests = {
+        codecs.JSON: (json.dumps({"instances": instances.tolist()}).encode(), {}),
+        codecs.NPY: (npy_request.getvalue(), {}),
+        codecs.RAW: (
+            instances.astype("<f4").tobytes(),
+            {codecs.SHAPE_HEADER: f"{args.rows},4"},
+        ),
+    }
+
+    def encode_json():
+        names = [iris.target_names[class_num] for class_num in class_indices]
+        return json.dumps({"predictions": names}).encode()
+
+    print(
+        f"{'format':>26} {'request KB':>11} {'decode ms':>10} "
+        f"{'response KB':>12} {'encode ms':>10}"
+    )
+    for media_type, (body, headers) in requests.items():
+        if media_type == codecs.JSON:
+            encode = encode_json
+        else:
+
+            def encode():
+                return codecs.encode_predictions(class_indices, media_type).body
+
+        decode_seconds = _median_seconds(
+            lambda: codecs.decode_instances(body, media_type, headers), args.repeats
+        )
+        encode_seconds = _median_seconds(encode, args.repeats)
+        print(
+            f"{media_type:>26} {len(body) / 1024:>11.0f} "
+            f"{decode_seconds * 1000:>10.2f} {len(encode()) / 1024:>12.0f} "
+            f"{encode_seconds * 1000:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Check the compiled forest against `RandomForestClassifier.predict`, and compare
+their latency and throughput at increasing batch sizes.
+
+Run from the `1_model_deployment` directory:
+
+    python -m benchmarks.compiled_forest --batch-sizes 1 100 10000 100000
+"""
+
+# Python Standard Library Imports
+import argparse
+import time
+
+# Third Party Imports
+import numpy as np
+from sklearn.datasets import load_iris
+from sklearn.ensemble import RandomForestClassifier
+
+# app Imports
+from app.forest import compile_forest
+
+
+def _median_latency(predict, inputs, repeats):
+    latencies = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        predict(inputs)
+        latencies.append(time.perf_counter() - start)
+    return float(np.median(latencies))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--batch-sizes",
+        type=int,
+        nargs="+",
+        default=[1, 10, 100, 1_000, 10_000, 100_000],
+    )
+    parser.add_argument("--repeats", type=int, default=10)
+    args = parser.parse_args()
+
+    iris = load_iris()
+    model = RandomForestClassifier(random_state=0).fit(iris.data, iris.target)
+    compiled = compile_forest(model)
+
+    rng = np.random.default_rng(0)
+    print(
+        f"{'batch':>8} {'sklearn ms':>11} {'compiled ms':>12} "
+        f"{'sklearn rows/s':>15} {'compiled rows/s':>16}"
+    )
+    for batch_size in args.batch_sizes:
+        inputs = iris.data[rng.integers(0, len(iris.data), size=batch_size)]
+        if not np.array_equal(compiled.predict(inputs), model.predict(inputs)):
+            raise AssertionError(f"Predictions differ at batch size {batch_size}")
+
+        sklearn_latency = _median_latency(model.predict, inputs, args.repeats)
+        compiled_latency = _median_latency(compiled.predict, inputs, args.repeats)
+        print(
+            f"{batch_size:>8} {sklearn_latency * 1000:>11.3f} "
+            f"{compiled_latency * 1000:>12.3f} "
+            f"{batch_size / sklearn_latency:>15.0f} "
+            f"{batch_size / compiled_latency:>16.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark rows/sec and latency of the micro-batcher against calling the model
+once per request, at increasing numbers of concurrent clients.
+
+Run from the `1_model_deployment` directory:
+
+    python -m benchmarks.micro_batching --concurrency 1 8 32 128
+"""
+
+# Python Standard Library Imports
+import argparse
+import asyncio
+import time
+
+# Third Party Imports
+import numpy as np
+from sklearn.datasets import load_iris
+from sklearn.ensemble import RandomForestClassifier
+
+# app Imports
+from app.batching import MicroBatcher
+
+
+async def _client(batcher, rows, deadline, latencies):
+    inputs = np.asarray([[6.7, 3.1, 4.7, 1.5]] * rows)
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        await batcher.predict(inputs)
+        latencies.append(time.perf_counter() - start)
+
+
+async def _run(batcher, concurrency, rows, duration):
+    latencies = []
+    deadline = time.perf_counter() + duration
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(_client(batcher, rows, deadline, latencies) for _ in range(concurrency))
+    )
+    elapsed = time.perf_counter() - start
+    return len(latencies) * rows / elapsed, np.percentile(latencies, [50, 99]) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32, 128])
+    parser.add_argument("--rows-per-request", type=int, default=1)
+    parser.add_argument("--duration", type=float, default=3.0)
+    parser.add_argument("--max-batch-size", type=int, default=64)
+    parser.add_argument("--max-wait-ms", type=float, default=2.0)
+    args = parser.parse_args()
+
+    iris = load_iris()
+    model = RandomForestClassifier(random_state=0).fit(iris.data, iris.target)
+
+    print(f"{'mode':>8} {'clients':>8} {'rows/s':>10} {'p50 ms':>8} {'p99 ms':>8}")
+    for concurrency in args.concurrency:
+        for mode, enabled in (("direct", False), ("batched", True)):
+            batcher = MicroBatcher(
+                model.predict,
+                max_batch_size=args.max_batch_size,
+                max_wait_ms=args.max_wait_ms,
+                enabled=enabled,
+            )
+            rows_per_second, (p50, p99) = asyncio.run(
+                _run(batcher, concurrency, args.rows_per_request, args.duration)
+            )
+            print(
+                f"{mode:>8} {concurrency:>8} {rows_per_second:>10.0f} "
+                f"{p50:>8.2f} {p99:>8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
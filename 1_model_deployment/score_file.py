@@ -0,0 +1,40 @@
+"""
+Score a newline-delimited JSON file of iris measurements with a trained model,
+one chunk of rows at a time, so memory use stays constant however large the
+file is.
+
+Each input line holds one row of features, e.g. `[6.7, 3.1, 4.7, 1.5]`, and
+each output line holds its prediction, e.g. `{"prediction": "versicolor"}`.
+Use `-` to read from stdin or write to stdout.
+"""
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    from loguru import logger
+    from sklearn.datasets import load_iris
+
+    from app import settings
+    from app.model_io import load_model
+    from app.streaming import encode_predictions, iter_row_chunks
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("input", help="NDJSON file of rows to score")
+    parser.add_argument("output", nargs="?", default="-", help="NDJSON predictions")
+    parser.add_argument("--model", default=settings.MODEL_FILENAME)
+    parser.add_argument("--chunk-size", type=int, default=settings.STREAM_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    logger.info(f"Loading model from {args.model}")
+    model = load_model(args.model, mmap=settings.MODEL_MMAP)
+    class_names = load_iris().target_names
+
+    input_f = sys.stdin.buffer if args.input == "-" else open(args.input, "rb")
+    output_f = sys.stdout.buffer if args.output == "-" else open(args.output, "wb")
+    n_rows = 0
+    with input_f, output_f:
+        for inputs in iter_row_chunks(input_f, args.chunk_size):
+            output_f.write(encode_predictions(model.predict(inputs), class_names))
+            n_rows += len(inputs)
+    logger.info(f"Scored {n_rows} rows")
@@ -0,0 +1,49 @@
+# Python Standard Library Imports
+import importlib
+
+# Third Party Imports
+import joblib
+import pytest
+from fastapi.testclient import TestClient
+from sklearn.datasets import load_iris
+from sklearn.ensemble import RandomForestClassifier
+
+
+@pytest.fixture
+def storage_dir(tmp_path):
+    """
+    A local directory standing in for the Cloud Storage bucket the trained
+    model is uploaded to
+    """
+    iris = load_iris()
+    model = RandomForestClassifier(n_estimators=10, random_state=0)
+    model.fit(iris.data, iris.target)
+    storage_dir = tmp_path / "storage"
+    storage_dir.mkdir()
+    joblib.dump(model, storage_dir / "model.joblib")
+    return storage_dir
+
+
+@pytest.fixture
+def vertex_app(storage_dir, tmp_path, monkeypatch):
+    """
+    `app.main`, configured the way Vertex AI would, but serving the model in
+    `storage_dir`
+    """
+    monkeypatch.setenv("AIP_STORAGE_URI", str(storage_dir))
+    monkeypatch.setenv("AIP_HEALTH_ROUTE", "/health")
+    monkeypatch.setenv("AIP_PREDICT_ROUTE", "/predict")
+    monkeypatch.setenv("ARTIFACT_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("MODEL_POLL_INTERVAL_SECONDS", "0")
+    # app Imports
+    from app import main, settings
+
+    importlib.reload(settings)
+    return importlib.reload(main)
+
+
+@pytest.fixture
+def vertex_client(vertex_app):
+    with TestClient(vertex_app.app) as client:
+        vertex_app._server.registry._thread.join()
+        yield client
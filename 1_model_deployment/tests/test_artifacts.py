@@ -0,0 +1,65 @@
+# Python Standard Library Imports
+import shutil
+
+# Third Party Imports
+import pytest
+
+# app Imports
+from app.artifacts import ArtifactCache, LocalArtifactSource, artifact_source
+from app.registry import FAILED, READY, ModelRegistry
+
+
+class CountingSource(LocalArtifactSource):
+    def __init__(self, directory):
+        super().__init__(directory)
+        self.downloads = 0
+
+    def download(self, name, destination):
+        self.downloads += 1
+        super().download(name, destination)
+
+
+def test_cache_only_downloads_changed_artifacts(storage_dir, tmp_path):
+    source = CountingSource(storage_dir)
+    cache = ArtifactCache(tmp_path / "cache")
+
+    first_path = cache.fetch(source, "model.joblib")
+    assert cache.fetch(source, "model.joblib") == first_path
+    assert source.downloads == 1
+
+    shutil.copyfile(storage_dir / "model.joblib", storage_dir / "other.joblib")
+    (storage_dir / "model.joblib").write_bytes(b"retrained")
+    second_path = cache.fetch(source, "model.joblib")
+
+    assert second_path != first_path
+    assert second_path.read_bytes() == b"retrained"
+    assert source.downloads == 2
+
+
+def test_local_paths_and_file_uris_are_local_sources(storage_dir):
+    for storage_uri in (str(storage_dir), f"file://{storage_dir}"):
+        source = artifact_source(storage_uri)
+        assert isinstance(source, LocalArtifactSource)
+        assert source.directory == storage_dir
+
+
+def test_registry_reports_failure_for_missing_artifact(storage_dir, tmp_path):
+    registry = ModelRegistry(
+        LocalArtifactSource(storage_dir), ArtifactCache(tmp_path), "missing.joblib"
+    )
+
+    registry.start().join()
+
+    assert registry.state == FAILED
+    assert isinstance(registry.error, FileNotFoundError)
+
+
+def test_vertex_service_loads_model_from_local_storage(vertex_app, vertex_client):
+    assert vertex_app._server.registry.state == READY
+    assert vertex_client.get("/health").status_code == 200
+
+    response = vertex_client.post(
+        "/predict", json={"instances": [[6.7, 3.1, 4.7, 1.5], [4.6, 3.1, 1.5, 0.2]]}
+    )
+
+    assert response.json() == {"predictions": ["versicolor", "setosa"]}
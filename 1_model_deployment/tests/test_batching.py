@@ -0,0 +1,70 @@
+# Python Standard Library Imports
+import asyncio
+
+# Third Party Imports
+import numpy as np
+import pytest
+
+# app Imports
+from app.batching import MicroBatcher
+
+
+class CountingModel:
+    def __init__(self):
+        self.batch_sizes = []
+
+    def predict(self, inputs: np.ndarray) -> np.ndarray:
+        if inputs.shape[1] != 4:
+            raise ValueError(f"Expected 4 features, got {inputs.shape[1]}")
+        self.batch_sizes.append(len(inputs))
+        return inputs.sum(axis=1)
+
+
+async def _predict_concurrently(batcher, requests):
+    return await asyncio.gather(
+        *(batcher.predict(inputs) for inputs in requests), return_exceptions=True
+    )
+
+
+def test_concurrent_requests_are_predicted_in_one_batch():
+    model = CountingModel()
+    batcher = MicroBatcher(model.predict, max_batch_size=64, max_wait_ms=50)
+    requests = [np.full((i % 3 + 1, 4), i, dtype=float) for i in range(10)]
+
+    outputs = asyncio.run(_predict_concurrently(batcher, requests))
+
+    assert model.batch_sizes == [sum(len(inputs) for inputs in requests)]
+    for inputs, output in zip(requests, outputs):
+        np.testing.assert_array_equal(output, inputs.sum(axis=1))
+
+
+def test_batches_are_capped_at_max_batch_size():
+    model = CountingModel()
+    batcher = MicroBatcher(model.predict, max_batch_size=4, max_wait_ms=50)
+    requests = [np.ones((1, 4)) for _ in range(10)]
+
+    asyncio.run(_predict_concurrently(batcher, requests))
+
+    assert model.batch_sizes == [4, 4, 2]
+
+
+def test_malformed_request_only_fails_its_own_caller():
+    model = CountingModel()
+    batcher = MicroBatcher(model.predict, max_batch_size=64, max_wait_ms=50)
+    requests = [np.ones((1, 4)), np.ones((1, 3)), np.ones((2, 4))]
+
+    good, bad, also_good = asyncio.run(_predict_concurrently(batcher, requests))
+
+    np.testing.assert_array_equal(good, [4.0])
+    assert isinstance(bad, ValueError)
+    np.testing.assert_array_equal(also_good, [4.0, 4.0])
+
+
+@pytest.mark.parametrize("enabled", [True, False])
+def test_batcher_can_be_reused_across_event_loops(enabled):
+    model = CountingModel()
+    batcher = MicroBatcher(model.predict, enabled=enabled)
+
+    for _ in range(2):
+        output = asyncio.run(batcher.predict(np.ones((1, 4))))
+        np.testing.assert_array_equal(output, [4.0])
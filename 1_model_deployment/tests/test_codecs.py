@@ -0,0 +1,75 @@
+# Python Standard Library Imports
+import io
+
+# Third Party Imports
+import numpy as np
+import pytest
+
+# app Imports
+from app import codecs
+
+INSTANCES = [[6.7, 3.1, 4.7, 1.5], [4.6, 3.1, 1.5, 0.2]]
+
+
+def _npy(array: np.ndarray) -> bytes:
+    content = io.BytesIO()
+    np.save(content, array)
+    return content.getvalue()
+
+
+@pytest.mark.parametrize("order", ["C", "F"])
+def test_npy_instances_are_decoded_without_copying(order):
+    instances = np.asarray(INSTANCES, dtype=np.float32, order=order)
+    body = _npy(instances)
+
+    decoded = codecs.decode_instances(body, codecs.NPY, {})
+
+    np.testing.assert_array_equal(decoded, instances)
+    assert np.shares_memory(decoded, np.frombuffer(body, dtype=np.uint8))
+
+
+def test_raw_instances_need_a_shape():
+    body = np.asarray(INSTANCES, dtype="<f4").tobytes()
+
+    decoded = codecs.decode_instances(body, codecs.RAW, {codecs.SHAPE_HEADER: "2,4"})
+
+    np.testing.assert_array_equal(decoded, np.asarray(INSTANCES, dtype=np.float32))
+    with pytest.raises(ValueError, match=codecs.SHAPE_HEADER):
+        codecs.decode_instances(body, codecs.RAW, {})
+
+
+@pytest.mark.parametrize(
+    "accept,expected",
+    [
+        (None, codecs.NPY),
+        ("*/*", codecs.NPY),
+        ("application/json", codecs.JSON),
+        ("text/html, application/octet-stream;q=0.9", codecs.RAW),
+    ],
+)
+def test_response_format_defaults_to_the_request_format(accept, expected):
+    assert codecs.negotiate(accept, codecs.NPY) == expected
+
+
+def test_vertex_service_answers_in_the_negotiated_format(vertex_client):
+    npy_response = vertex_client.post(
+        "/predict",
+        content=_npy(np.asarray(INSTANCES, dtype=np.float32)),
+        headers={"Content-Type": codecs.NPY},
+    )
+    raw_response = vertex_client.post(
+        "/predict",
+        json={"instances": INSTANCES},
+        headers={"Accept": codecs.RAW},
+    )
+    unsupported_response = vertex_client.post(
+        "/predict", content=b"6.7,3.1,4.7,1.5", headers={"Content-Type": "text/csv"}
+    )
+
+    assert npy_response.headers["content-type"] == codecs.NPY
+    np.testing.assert_array_equal(np.load(io.BytesIO(npy_response.content)), [1, 0])
+    assert raw_response.headers[codecs.SHAPE_HEADER] == "2"
+    np.testing.assert_array_equal(
+        np.frombuffer(raw_response.content, dtype="<i4"), [1, 0]
+    )
+    assert unsupported_response.status_code == 415
@@ -0,0 +1,43 @@
+# Python Standard Library Imports
+import asyncio
+
+# Third Party Imports
+import joblib
+import numpy as np
+import pytest
+from sklearn.datasets import load_iris
+from sklearn.ensemble import RandomForestClassifier
+
+# app Imports
+from app.executor import InferenceExecutor
+
+
+@pytest.fixture(scope="module")
+def iris_model_path(tmp_path_factory):
+    iris = load_iris()
+    model = RandomForestClassifier(n_estimators=10, random_state=0)
+    model.fit(iris.data, iris.target)
+    model_path = tmp_path_factory.mktemp("model") / "model.joblib"
+    joblib.dump(model, model_path)
+    return model_path
+
+
+@pytest.mark.parametrize("backend", ["inline", "thread", "process"])
+def test_backends_match_model_predict(backend, iris_model_path):
+    model = joblib.load(iris_model_path)
+    inputs = load_iris().data
+    executor = InferenceExecutor(
+        model, model_path=iris_model_path, backend=backend, max_workers=2
+    )
+
+    try:
+        outputs = asyncio.run(executor.predict(inputs))
+    finally:
+        executor.shutdown()
+
+    np.testing.assert_array_equal(outputs, model.predict(inputs))
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError, match="Unknown inference backend"):
+        InferenceExecutor(model=None, backend="gpu")
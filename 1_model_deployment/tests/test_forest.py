@@ -0,0 +1,51 @@
+# Third Party Imports
+import numpy as np
+import pytest
+from sklearn.datasets import load_iris, make_classification
+from sklearn.ensemble import RandomForestClassifier
+
+# app Imports
+from app.forest import CompiledForest, compile_forest
+from app.model_io import load_model
+
+
+@pytest.fixture(scope="module")
+def iris_model():
+    iris = load_iris()
+    return RandomForestClassifier(random_state=0).fit(iris.data, iris.target)
+
+
+def test_compiled_forest_matches_model_predict(iris_model):
+    compiled = compile_forest(iris_model)
+    # sample well outside the training data too, to cover every split
+    rng = np.random.default_rng(0)
+    inputs = np.concatenate([load_iris().data, rng.uniform(0, 8, size=(5000, 4))])
+
+    np.testing.assert_array_equal(compiled.predict(inputs), iris_model.predict(inputs))
+    np.testing.assert_allclose(
+        compiled.predict_proba(inputs), iris_model.predict_proba(inputs)
+    )
+
+
+def test_compiled_forest_matches_across_chunks_and_string_labels():
+    X, y = make_classification(
+        n_samples=500, n_features=10, n_informative=6, n_classes=4, random_state=0
+    )
+    labels = np.array(["a", "b", "c", "d"])[y]
+    model = RandomForestClassifier(n_estimators=25, max_depth=6, random_state=0)
+    model.fit(X, labels)
+    compiled = compile_forest(model)
+    compiled.chunk_size = 64
+
+    np.testing.assert_array_equal(compiled.predict(X), model.predict(X))
+
+
+def test_compiled_forest_round_trips_through_npz(iris_model, tmp_path):
+    model_path = tmp_path / "model.npz"
+    compile_forest(iris_model).save(model_path)
+
+    loaded = load_model(model_path)
+
+    assert isinstance(loaded, CompiledForest)
+    inputs = load_iris().data
+    np.testing.assert_array_equal(loaded.predict(inputs), iris_model.predict(inputs))
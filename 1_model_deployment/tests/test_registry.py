@@ -0,0 +1,86 @@
+# Python Standard Library Imports
+import os
+
+# Third Party Imports
+import joblib
+import numpy as np
+import pytest
+from sklearn.datasets import load_iris
+from sklearn.dummy import DummyClassifier
+
+# app Imports
+from app.artifacts import ArtifactCache, LocalArtifactSource
+from app.registry import READY, ModelRegistry
+
+
+def _train(storage_dir, constant, mtime):
+    iris = load_iris()
+    model = DummyClassifier(strategy="constant", constant=constant)
+    model.fit(iris.data, iris.target)
+    model_path = storage_dir / "model.joblib"
+    joblib.dump(model, model_path)
+    # make sure the fingerprint changes even on coarse filesystem clocks
+    os.utime(model_path, ns=(mtime, mtime))
+
+
+@pytest.fixture
+def registry(tmp_path):
+    storage_dir = tmp_path / "storage"
+    storage_dir.mkdir()
+    _train(storage_dir, constant=0, mtime=1_000_000_000)
+    loaded = []
+    registry = ModelRegistry(
+        LocalArtifactSource(storage_dir),
+        ArtifactCache(tmp_path / "cache"),
+        "model.joblib",
+        on_load=lambda model, model_path: loaded.append(model_path),
+        warmup_inputs=np.asarray([[6.7, 3.1, 4.7, 1.5]]),
+    )
+    registry.storage_dir = storage_dir
+    registry.loaded = loaded
+    return registry
+
+
+def test_new_model_version_is_swapped_in(registry):
+    inputs = load_iris().data[:5]
+    registry.poll()
+    assert registry.state == READY
+    in_flight_model = registry.model
+
+    _train(registry.storage_dir, constant=2, mtime=2_000_000_000)
+    registry.poll()
+
+    assert (registry.model.predict(inputs) == 2).all()
+    # a request that picked up the old version before the swap still finishes
+    assert (in_flight_model.predict(inputs) == 0).all()
+    assert len(registry.loaded) == 2
+    assert registry.loaded[0] != registry.loaded[1]
+    description = registry.describe()
+    assert description["active"]["version"] == registry.active.version
+    assert [version["version"] for version in description["history"]] == [
+        registry.history[0].version,
+        registry.active.version,
+    ]
+
+
+def test_unchanged_artifact_is_not_reloaded(registry):
+    registry.poll()
+    registry.poll()
+
+    assert len(registry.loaded) == 1
+
+
+def test_broken_version_keeps_the_previous_one_serving(registry):
+    registry.poll()
+    serving_version = registry.active.version
+
+    model_path = registry.storage_dir / "model.joblib"
+    model_path.write_bytes(b"not a model")
+    os.utime(model_path, ns=(3_000_000_000, 3_000_000_000))
+    registry.poll()
+    registry.poll()
+
+    assert registry.active.version == serving_version
+    assert registry.state == READY
+    assert registry.error is not None
+    assert len(registry.loaded) == 1
@@ -0,0 +1,62 @@
+# Python Standard Library Imports
+import asyncio
+import json
+
+# Third Party Imports
+import numpy as np
+
+# app Imports
+from app.streaming import aiter_lines, aiter_row_chunks, iter_row_chunks
+
+ROWS = [[6.7, 3.1, 4.7, 1.5], [4.6, 3.1, 1.5, 0.2], [5.9, 3.0, 5.1, 1.8]]
+
+
+def _ndjson(rows) -> bytes:
+    return b"".join(json.dumps(row).encode() + b"\n" for row in rows)
+
+
+def test_rows_are_chunked_and_blank_lines_skipped():
+    lines = _ndjson(ROWS).replace(b"\n", b"\n\n", 1).splitlines()
+
+    chunks = list(iter_row_chunks(lines, chunk_size=2))
+
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    np.testing.assert_array_equal(np.concatenate(chunks), ROWS)
+
+
+def test_lines_are_reassembled_across_stream_chunks():
+    body = _ndjson(ROWS).rstrip(b"\n")
+
+    async def byte_stream():
+        # split the body at arbitrary points, including mid-number
+        for start in range(0, len(body), 7):
+            yield body[start : start + 7]
+
+    async def collect():
+        return [
+            chunk async for chunk in aiter_row_chunks(aiter_lines(byte_stream()), 2)
+        ]
+
+    np.testing.assert_array_equal(np.concatenate(asyncio.run(collect())), ROWS)
+
+
+def test_vertex_service_streams_predictions(vertex_client):
+    response = vertex_client.post(
+        "/predict/stream",
+        content=_ndjson(ROWS * 1000),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+
+    predictions = [json.loads(line) for line in response.text.splitlines()]
+    assert len(predictions) == 3000
+    assert predictions[:3] == [
+        {"prediction": "versicolor"},
+        {"prediction": "setosa"},
+        {"prediction": "virginica"},
+    ]
+
+
+def test_malformed_rows_end_the_stream_with_an_error(vertex_client):
+    response = vertex_client.post("/predict/stream", content=b"[6.7, 3.1\n")
+
+    assert "error" in json.loads(response.text.splitlines()[-1])
@@ -1,6 +1,7 @@
 """
 Train a scikit learn model on the iris dataset and save it as an artifact
 """
+
 if __name__ == "__main__":
     import pathlib
 
@@ -9,6 +10,8 @@ if __name__ == "__main__":
     from sklearn.datasets import load_iris
     from sklearn.ensemble import RandomForestClassifier
 
+    from app.forest import compile_forest
+
     logger.info("Loading iris dataset")
     iris = load_iris()
 
@@ -24,3 +27,7 @@ if __name__ == "__main__":
     model_path = pathlib.Path("model.joblib")
     logger.info(f"Saving model to {model_path}")
     joblib.dump(model, model_path)
+
+    compiled_model_path = pathlib.Path("model.npz")
+    logger.info(f"Saving compiled forest to {compiled_model_path}")
+    compile_forest(model).save(compiled_model_path)